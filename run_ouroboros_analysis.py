@@ -6,18 +6,18 @@ Hillary Danan - August 2025
 """
 
 import sys
-import os
 sys.path.append('src')
 
-import json
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
 from datetime import datetime
 from scipy import stats
 from typing import Dict, List 
-from src.ouroboros_analyzer import OuroborosAnalyzer
+from src.ouroboros_analyzer import OuroborosAnalyzer, serialize_json
 from src.ouroboros_visualizer import OuroborosVisualizer
-from src.config import OUROBOROS_CONFIG
+from src.config import OUROBOROS_CONFIG, MODELS
 
 def print_header():
     """Print the beautiful header."""
@@ -27,13 +27,40 @@ def print_header():
     print("           Hillary Danan - August 2025")
     print("="*60 + "\n")
 
+# Output directories used by the analysis pipeline
+DIRECTORIES = tuple(Path(d) for d in ('data', 'results', 'plots', 'notebooks', 'tests'))
+
 def create_directories():
     """Create necessary directories if they don't exist."""
-    directories = ['data', 'results', 'plots', 'notebooks', 'tests']
-    for dir_name in directories:
-        os.makedirs(dir_name, exist_ok=True)
+    for directory in DIRECTORIES:
+        directory.mkdir(exist_ok=True)
     print("✅ Directory structure created")
 
+def _render_model_plots(args) -> List[str]:
+    """
+    Render the static and interactive example plots for one model.
+    
+    Args:
+        args: Tuple of (model name, example session, output directory)
+        
+    Returns:
+        List of saved plot filenames
+    """
+    model, session, out_dir = args
+    visualizer = OuroborosVisualizer()
+    
+    # Static plot
+    fig = visualizer.plot_coherence_cycles(session)
+    plot_filename = f'{out_dir}/ouroboros_{model}_example.png'
+    fig.savefig(plot_filename, dpi=150, bbox_inches='tight')
+    
+    # Interactive plot
+    interactive_fig = visualizer.create_interactive_cycle_plot(session)
+    interactive_filename = f'{out_dir}/ouroboros_{model}_interactive.html'
+    interactive_fig.write_html(interactive_filename)
+    
+    return [plot_filename, interactive_filename]
+
 def analyze_model_differences(all_sessions: Dict[str, List]) -> pd.DataFrame:
     """
     Compare ouroboros patterns across different models.
@@ -245,7 +272,7 @@ def main():
     analyzer = OuroborosAnalyzer()
     
     # Models to test (using simplified names for testing)
-    models = list(OUROBOROS_CONFIG['models_to_test'].keys())
+    models = MODELS
     print(f"Models to analyze: {', '.join(models)}")
     
     # Number of sessions per model (reduced for testing)
@@ -266,8 +293,8 @@ def main():
         # Save raw data
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f'data/ouroboros_{model}_{timestamp}.json'
-        with open(filename, 'w') as f:
-            json.dump(sessions, f, indent=2, default=str)
+        with open(filename, 'wb') as f:
+            f.write(serialize_json(sessions, indent=True))
         
         print(f"✅ Completed {len(sessions)} sessions for {model}")
         print(f"💾 Data saved to {filename}")
@@ -297,20 +324,13 @@ def main():
     print("\n🎨 Creating visualizations...")
     visualizer = OuroborosVisualizer()
     
-    # Create plots for each model (first session as example)
-    for model, sessions in all_sessions.items():
-        if sessions:
-            # Static plot
-            fig = visualizer.plot_coherence_cycles(sessions[0])
-            plot_filename = f'plots/ouroboros_{model}_example.png'
-            fig.savefig(plot_filename, dpi=150, bbox_inches='tight')
-            print(f"  📊 Saved plot: {plot_filename}")
-            
-            # Interactive plot
-            interactive_fig = visualizer.create_interactive_cycle_plot(sessions[0])
-            interactive_filename = f'plots/ouroboros_{model}_interactive.html'
-            interactive_fig.write_html(interactive_filename)
-            print(f"  🌐 Saved interactive: {interactive_filename}")
+    # Create plots for each model (first session as example), one process per model
+    plot_jobs = [(model, sessions[0], 'plots') for model, sessions in all_sessions.items() if sessions]
+    if plot_jobs:
+        with ProcessPoolExecutor(max_workers=len(plot_jobs)) as executor:
+            for plot_filename, interactive_filename in executor.map(_render_model_plots, plot_jobs):
+                print(f"  📊 Saved plot: {plot_filename}")
+                print(f"  🌐 Saved interactive: {interactive_filename}")
     
     # Model comparison plot
     if not model_stats.empty:
@@ -5,15 +5,30 @@ Hillary Danan - August 2025
 """
 
 import os
+import threading
 import openai
 import anthropic
 import google.generativeai as genai
 from typing import List, Optional
 from dotenv import load_dotenv
 import time
+from config import OUROBOROS_CONFIG
 
 load_dotenv()
 
+# Speaker labels used when flattening chat messages into a Gemini prompt
+ROLE_PREFIX = {
+    'user': 'User',
+    'assistant': 'Assistant',
+    'system': 'System'
+}
+
+# System message shared by every request; built once at import
+SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are participating in a research study on cognitive patterns. Please respond naturally and thoughtfully to each prompt."
+}
+
 class RealModelAPI:
     """
     Real API calls to actual models for empirical data collection.
@@ -21,6 +36,9 @@ class RealModelAPI:
     
     def __init__(self):
         """Initialize API clients with real keys."""
+        # Number of previous responses replayed to the model on each call
+        self.history_window = OUROBOROS_CONFIG.get('history_window')
+        
         # OpenAI
         self.openai_key = os.getenv('OPENAI_API_KEY')
         if self.openai_key:
@@ -89,22 +107,15 @@ class RealModelAPI:
         Returns:
             Formatted conversation for API
         """
-        messages = []
-        
-        # Add system message for consistency
-        messages.append({
-            "role": "system",
-            "content": "You are participating in a research study on cognitive patterns. Please respond naturally and thoughtfully to each prompt."
-        })
+        # Start from the shared system message for consistency
+        messages = [SYSTEM_MSG]
         
-        # Add conversation history (alternating user/assistant)
-        for i, response in enumerate(history):
-            # Previous prompts would have been user messages
-            if i < len(history):
-                messages.append({
-                    "role": "assistant",
-                    "content": response
-                })
+        # Add the most recent conversation history as assistant turns (None = full history, 0 = none)
+        if self.history_window is None:
+            recent_history = history
+        else:
+            recent_history = history[-self.history_window:] if self.history_window > 0 else []
+        messages.extend({"role": "assistant", "content": response} for response in recent_history)
         
         # Add current prompt
         messages.append({
@@ -206,16 +217,9 @@ class RealModelAPI:
         
         try:
             # Build Gemini prompt from messages
-            prompt_parts = []
-            for msg in messages:
-                if msg["role"] == "user":
-                    prompt_parts.append(f"User: {msg['content']}")
-                elif msg["role"] == "assistant":
-                    prompt_parts.append(f"Assistant: {msg['content']}")
-                elif msg["role"] == "system":
-                    prompt_parts.append(f"System: {msg['content']}")
-            
-            full_prompt = "\n\n".join(prompt_parts)
+            full_prompt = "\n\n".join(
+                f"{ROLE_PREFIX[msg['role']]}: {msg['content']}" for msg in messages
+            )
             full_prompt += "\n\nAssistant:"
             
             response = self.gemini_model.generate_content(
@@ -313,6 +317,9 @@ class RealModelAPI:
 # Global API instance
 api_client = None
 
+# Collection threads may make their first call at the same time; build one client only
+_api_client_lock = threading.Lock()
+
 def initialize_apis():
     """Initialize the global API client."""
     global api_client
@@ -335,6 +342,8 @@ def get_real_model_response(model_name: str, prompt: str,
     global api_client
     
     if api_client is None:
-        api_client = initialize_apis()
+        with _api_client_lock:
+            if api_client is None:
+                initialize_apis()
     
     return api_client.get_response(model_name, prompt, conversation_history)
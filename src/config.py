@@ -5,6 +5,8 @@ Hillary Danan - August 2025
 <4577> <45774EVER
 """
 
+from types import MappingProxyType
+
 OUROBOROS_CONFIG = {
     'phases': {
         'integration': {
@@ -25,6 +27,8 @@ OUROBOROS_CONFIG = {
         }
     },
     'conversation_length': 20,
+    'min_cycle_length': 3,  # Shorter coherence series cannot hold a peak; skip detection
+    'history_window': None,  # Most recent responses sent back as context (None = all, as in stored runs; 0 = none)
     'models_to_test': {
         'gpt-3.5-turbo': {
             'expected_coherence': 0.383,
@@ -39,6 +43,8 @@ OUROBOROS_CONFIG = {
             'api_key_env': 'GOOGLE_API_KEY'
         }
     },
+    'max_concurrent_sessions': 2,  # Sessions per model in parallel; API helpers only sleep 5 s per call, no backoff
+    'response_cache_dir': None,  # e.g. 'cache' to replay identical API calls during development
     'prompts_per_model': 10,  # START WITH 2 FOR TESTING - CHANGE TO 50 FOR FULL STUDY
     'metrics_to_track': [
         'coherence_score',
@@ -101,3 +107,20 @@ OUROBOROS_PROMPTS = [
     "What would you forget if you could?",
     "What new connections do you see?"
 ]
+
+# Pre-sliced views of the configuration for hot-path lookups
+MODELS = tuple(OUROBOROS_CONFIG['models_to_test'])
+PHASES = tuple(OUROBOROS_CONFIG['phases'])
+PHASE_MARKERS = {phase: tuple(config['markers']) for phase, config in OUROBOROS_CONFIG['phases'].items()}
+
+def _freeze(value):
+    """Read-only copy of a nested config value: dicts become mapping proxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+# Freeze the whole configuration, nested phase/model dicts and marker lists included
+OUROBOROS_CONFIG = _freeze(OUROBOROS_CONFIG)
+
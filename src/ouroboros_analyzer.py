@@ -7,7 +7,6 @@ Hillary Danan - August 2025
 """
 
 import numpy as np
-import pandas as pd
 from scipy import signal, stats
 from typing import Dict, List, Tuple, Optional
 import json
@@ -15,7 +14,54 @@ from datetime import datetime
 import hashlib
 from collections import Counter
 import os
-from config import OUROBOROS_CONFIG, OUROBOROS_PROMPTS
+import asyncio
+import shelve
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from config import OUROBOROS_CONFIG, OUROBOROS_PROMPTS, PHASES, PHASE_MARKERS
+from ouroboros_utils import stack_phase_markers
+import ouroboros_kernels
+
+# Population count for token bitsets (int.bit_count needs Python 3.10+)
+_popcount = getattr(int, 'bit_count', lambda bits: bin(bits).count('1'))
+
+# Prefixes of error strings returned by the API helpers; never recorded or cached
+API_ERROR_PREFIXES = ('Error', 'OpenAI error', 'Anthropic error', 'Gemini error')
+API_KEY_MISSING_SUFFIX = 'API key not configured'
+
+def _is_api_error(response: Optional[str]) -> bool:
+    """True for empty responses and the error/missing-key strings returned by the API helpers."""
+    return (not response
+            or response.startswith(API_ERROR_PREFIXES)
+            or response.endswith(API_KEY_MISSING_SUFFIX))
+
+def _json_default(obj):
+    """Fallback JSON encoding: NumPy values as Python values, anything else as str."""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    return str(obj)
+
+def serialize_json(data, indent: bool = False) -> bytes:
+    """
+    Serialize session data to JSON bytes, natively handling NumPy values.
+    
+    Args:
+        data: Data to serialize
+        indent: Pretty-print with two-space indentation
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option, default=_json_default)
+    return json.dumps(data, indent=2 if indent else None, default=_json_default).encode()
 
 class OuroborosAnalyzer:
     """
@@ -31,10 +77,28 @@ class OuroborosAnalyzer:
             tide_analyzer: Optional TIDE analyzer for integration
         """
         self.tide = tide_analyzer
-        self.phases = ['integration', 'consumption', 'transformation', 'generation']
+        self.phases = list(PHASES)
         self.phase_markers = OUROBOROS_CONFIG['phases']
         self.config = OUROBOROS_CONFIG
         
+        # Prompt sequence is identical for every session
+        self._prompts = tuple(OUROBOROS_PROMPTS[:self.config['conversation_length']])
+        
+        # Flat (phase, markers, marker count) table for phase marker scoring
+        self._phase_marker_table = tuple(
+            (phase, markers, len(markers)) for phase, markers in PHASE_MARKERS.items()
+        )
+        
+        # Serializes intermediate saves across collection threads
+        self._save_lock = threading.Lock()
+        
+        # Optional on-disk response cache (development re-runs only)
+        self._response_cache_dir = self.config.get('response_cache_dir')
+        self._cache_lock = threading.Lock()
+        
+        # Compile numerical kernels up front
+        ouroboros_kernels.warmup()
+        
     def collect_ouroboros_data(self, model_name: str, num_sessions: int = 50) -> List[Dict]:
         """
         Collect conversation data specifically designed to detect ouroboros patterns.
@@ -47,18 +111,56 @@ class OuroborosAnalyzer:
             List of session data dictionaries
         """
         sessions = []
-        
-        for session_id in range(num_sessions):
-            print(f"  Session {session_id + 1}/{num_sessions} for {model_name}")
-            conversation = self.run_ouroboros_conversation(model_name, session_id)
-            sessions.append(conversation)
-            
-            # Save intermediate results
-            if (session_id + 1) % 10 == 0:
-                self._save_intermediate_results(sessions, model_name)
+        checkpoint_file = self._new_checkpoint_file(model_name)
+        
+        # Sessions are network-bound, so threads overlap the API latency
+        max_workers = self.config.get('max_concurrent_sessions', 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.run_ouroboros_conversation, model_name, session_id)
+                for session_id in range(num_sessions)
+            ]
+            
+            for future in as_completed(futures):
+                session = future.result()
+                sessions.append(session)
+                print(f"  Session {len(sessions)}/{num_sessions} for {model_name}")
                 
+                # Save intermediate results
+                self._save_intermediate_results(session, checkpoint_file)
+                if len(sessions) % 10 == 0:
+                    print(f"    💾 Saved intermediate results: {checkpoint_file}")
+        
+        sessions.sort(key=lambda session: session['session_id'])
         return sessions
     
+    async def collect_ouroboros_data_async(self, model_name: str, num_sessions: int = 50) -> List[Dict]:
+        """
+        Asyncio variant of collect_ouroboros_data.
+        
+        Args:
+            model_name: Name of the model to test
+            num_sessions: Number of conversation sessions
+            
+        Returns:
+            List of session data dictionaries, in session order
+        """
+        checkpoint_file = self._new_checkpoint_file(model_name)
+        semaphore = asyncio.Semaphore(self.config.get('max_concurrent_sessions', 2))
+        completed = 0
+        
+        async def run_session(session_id: int) -> Dict:
+            nonlocal completed
+            async with semaphore:
+                session = await self.run_ouroboros_conversation_async(model_name, session_id)
+            
+            completed += 1
+            print(f"  Session {completed}/{num_sessions} for {model_name}")
+            self._save_intermediate_results(session, checkpoint_file)
+            return session
+        
+        return list(await asyncio.gather(*(run_session(i) for i in range(num_sessions))))
+    
     def run_ouroboros_conversation(self, model_name: str, session_id: int) -> Dict:
         """
         Run a single conversation designed to potentially trigger ouroboros cycles.
@@ -70,7 +172,55 @@ class OuroborosAnalyzer:
         Returns:
             Dictionary containing conversation data and metrics
         """
-        conversation_data = {
+        conversation_data = self._new_conversation(model_name, session_id)
+        
+        # Phase 1: generate the whole conversation
+        for prompt in self.generate_ouroboros_prompts():
+            # Get response (stub for now - will be replaced with actual API calls)
+            response = self._get_model_response(model_name, prompt, conversation_data['responses'],
+                                                session_id)
+            
+            conversation_data['prompts'].append(prompt)
+            conversation_data['responses'].append(response)
+            
+        # Phase 2: analyze the completed conversation
+        return self._analyze_conversation(conversation_data)
+    
+    async def run_ouroboros_conversation_async(self, model_name: str, session_id: int) -> Dict:
+        """
+        Asyncio variant of run_ouroboros_conversation.
+        
+        Args:
+            model_name: Name of the model
+            session_id: Unique session identifier
+            
+        Returns:
+            Dictionary containing conversation data and metrics
+        """
+        conversation_data = self._new_conversation(model_name, session_id)
+        
+        for prompt in self.generate_ouroboros_prompts():
+            response = await self._get_model_response_async(
+                model_name, prompt, conversation_data['responses'], session_id
+            )
+            
+            conversation_data['prompts'].append(prompt)
+            conversation_data['responses'].append(response)
+            
+        return self._analyze_conversation(conversation_data)
+    
+    def _new_conversation(self, model_name: str, session_id: int) -> Dict:
+        """
+        Create an empty conversation record.
+        
+        Args:
+            model_name: Name of the model
+            session_id: Unique session identifier
+            
+        Returns:
+            Conversation data dictionary
+        """
+        return {
             'session_id': session_id,
             'model': model_name,
             'timestamp': datetime.now().isoformat(),
@@ -78,43 +228,49 @@ class OuroborosAnalyzer:
             'metrics': [],
             'prompts': []
         }
+    
+    def _analyze_conversation(self, conversation_data: Dict) -> Dict:
+        """
+        Calculate metrics, cycles and statistics for a generated conversation.
         
-        # Get prompts for this session
-        prompts = self.generate_ouroboros_prompts()
-        
-        for i, prompt in enumerate(prompts):
-            # Get response (stub for now - will be replaced with actual API calls)
-            response = self._get_model_response(model_name, prompt, conversation_data['responses'])
-            
-            # Calculate metrics
-            metrics = self.calculate_response_metrics(response, i, conversation_data['responses'])
+        Args:
+            conversation_data: Conversation with all prompts and responses
             
-            conversation_data['prompts'].append(prompt)
-            conversation_data['responses'].append(response)
-            conversation_data['metrics'].append(metrics)
+        Returns:
+            The same dictionary with metrics, cycles and statistics filled in
+        """
+        # Calculate metrics for all responses at once
+        conversation_data['metrics'], metrics_soa = self._batch_compute_metrics(conversation_data['responses'])
             
         # Analyze for cycles
         conversation_data['cycles'] = self.detect_cycles(conversation_data['metrics'])
         
         # Calculate session-level statistics
-        conversation_data['statistics'] = self.calculate_session_statistics(conversation_data)
+        conversation_data['statistics'] = self.calculate_session_statistics(conversation_data, metrics_soa)
         
         return conversation_data
     
-    def generate_ouroboros_prompts(self) -> List[str]:
+    def generate_ouroboros_prompts(self) -> Tuple[str, ...]:
         """
         Generate prompts designed to potentially trigger ouroboros cycles.
         
         Returns:
-            List of prompts
+            Tuple of prompts
         """
-        return OUROBOROS_PROMPTS[:self.config['conversation_length']]
+        return self._prompts
     
     def calculate_response_metrics(self, response: str, position: int, 
                                   previous_responses: List[str]) -> Dict:
         """
         Calculate comprehensive metrics for ouroboros detection.
         
+        Scores the response together with its history through
+        _batch_compute_metrics, so single responses and whole
+        conversations share one implementation. Each call rescores the
+        whole history, so scoring a conversation turn by turn is O(N^2);
+        score completed conversations with _batch_compute_metrics
+        (as _analyze_conversation does) instead.
+        
         Args:
             response: Current response text
             position: Position in conversation
@@ -123,30 +279,130 @@ class OuroborosAnalyzer:
         Returns:
             Dictionary of metrics
         """
-        metrics = {
-            'position': position,
-            'length': len(response.split()),
-            'coherence': self._calculate_coherence(response),
-            'entropy': self.calculate_entropy(response),
-            'phase_markers': self.detect_phase_markers(response),
-            'lexical_diversity': self._calculate_lexical_diversity(response)
+        metrics_list, _ = self._batch_compute_metrics(list(previous_responses) + [response])
+        metrics = metrics_list[-1]
+        metrics['position'] = position
+        return metrics
+    
+    def _batch_compute_metrics(self, responses: List[str]) -> Tuple[List[Dict], Dict[str, np.ndarray]]:
+        """
+        Calculate metrics for a complete conversation in one pass.
+        
+        Every response is tokenized once into integer codes over a shared
+        session vocabulary, so length, entropy and lexical diversity come
+        from NumPy counts and similarities from cached bitsets.
+        
+        Args:
+            responses: All responses of the conversation, in order
+            
+        Returns:
+            List of metrics dictionaries, one per response, and the same
+            per-response metrics as column arrays (see _metrics_to_soa) plus
+            the session vocabulary size under 'vocab_size'
+        """
+        vocab_index = {}
+        words_per_response = [response.lower().split() for response in responses]
+        codes_per_response = [self._encode_words(words, vocab_index) for words in words_per_response]
+        lengths = np.array([codes.size for codes in codes_per_response], dtype=np.int32)
+        
+        metrics_soa = self._empty_metrics_soa(len(responses))
+        metrics_soa['length'][:] = lengths
+        
+        metrics_list = []
+        token_bits = []
+        cumulative_vocab = set()
+        
+        for i, (response, words, codes) in enumerate(zip(responses, words_per_response, codes_per_response)):
+            counts = self._word_counts(codes)
+            
+            metrics = {
+                'position': i,
+                'length': int(lengths[i]),
+                'coherence': self._calculate_coherence(response),
+                'entropy': self._entropy_of_counts(counts),
+                'phase_markers': self.detect_phase_markers(response),
+                'lexical_diversity': float(counts.size / lengths[i]) if lengths[i] else 0.0
+            }
+            
+            current_words = frozenset(words)
+            current_bits = self._encode_tokens(current_words, vocab_index)
+            
+            if i > 0:
+                metrics.update(self._history_metrics(
+                    current_words, current_bits, token_bits, cumulative_vocab
+                ))
+            
+            metrics_list.append(metrics)
+            token_bits.append(current_bits)
+            cumulative_vocab.update(current_words)
+            
+            metrics_soa['coherence'][i] = metrics['coherence']
+            metrics_soa['entropy'][i] = metrics['entropy']
+            metrics_soa['phase_vec'][i] = [metrics['phase_markers'][phase] for phase in self.phases]
+        
+        # Every distinct word of the session already has a code
+        metrics_soa['vocab_size'] = np.int64(len(vocab_index))
+            
+        return metrics_list, metrics_soa
+    
+    def _empty_metrics_soa(self, length: int) -> Dict[str, np.ndarray]:
+        """
+        Preallocate column arrays for the per-response metrics of a session.
+        
+        Args:
+            length: Number of responses
+            
+        Returns:
+            Dictionary of arrays keyed by metric name
+        """
+        return {
+            'position': np.arange(length, dtype=np.int32),
+            'length': np.empty(length, dtype=np.int32),
+            'coherence': np.empty(length, dtype=np.float64),
+            'entropy': np.empty(length, dtype=np.float64),
+            'phase_vec': np.empty((length, len(self.phases)), dtype=np.float64)
         }
+    
+    def _metrics_to_soa(self, metrics: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        Convert a list of metrics dictionaries into column arrays.
         
-        if previous_responses:
-            metrics['similarity_to_previous'] = self.calculate_similarity(
-                response, previous_responses[-1]
-            )
-            metrics['similarity_to_first'] = self.calculate_similarity(
-                response, previous_responses[0]
-            )
-            metrics['vocabulary_evolution'] = self.track_vocabulary_evolution(
-                response, previous_responses
-            )
-            metrics['semantic_drift'] = self._calculate_semantic_drift(
-                response, previous_responses
-            )
+        Args:
+            metrics: List of metrics
+            
+        Returns:
+            Dictionary of arrays keyed by metric name
+        """
+        metrics_soa = self._empty_metrics_soa(len(metrics))
+        metrics_soa['position'][:] = [m['position'] for m in metrics]
+        metrics_soa['length'][:] = [m['length'] for m in metrics]
+        metrics_soa['coherence'][:] = [m['coherence'] for m in metrics]
+        metrics_soa['entropy'][:] = [m['entropy'] for m in metrics]
+        metrics_soa['phase_vec'][:] = stack_phase_markers(metrics)
+        return metrics_soa
+    
+    def _history_metrics(self, current_words: frozenset, current_bits: int,
+                         token_bits: List[int], cumulative_vocab: set) -> Dict:
+        """
+        Metrics comparing a response with the responses before it.
         
-        return metrics
+        Args:
+            current_words: Word set of the current response
+            current_bits: Bitset of the current response
+            token_bits: Bitsets of the previous responses
+            cumulative_vocab: Union of the previous word sets
+            
+        Returns:
+            Dictionary of similarity, vocabulary and drift metrics
+        """
+        similarity_to_first = self._jaccard_bits(current_bits, token_bits[0])
+        
+        return {
+            'similarity_to_previous': self._jaccard_bits(current_bits, token_bits[-1]),
+            'similarity_to_first': similarity_to_first,
+            'vocabulary_evolution': self._vocabulary_evolution(current_words, cumulative_vocab),
+            'semantic_drift': 1.0 - similarity_to_first
+        }
     
     def calculate_entropy(self, text: str) -> float:
         """
@@ -158,13 +414,49 @@ class OuroborosAnalyzer:
         Returns:
             Shannon entropy value
         """
-        words = text.lower().split()
-        if not words:
-            return 0.0
+        codes = self._encode_words(text.lower().split(), {})
+        return self._entropy_of_counts(self._word_counts(codes))
+    
+    def _encode_words(self, words: List[str], vocab_index: Dict[str, int]) -> np.ndarray:
+        """
+        Map words to integer codes, growing the shared vocabulary as needed.
+        
+        Args:
+            words: Lowercased words of the response
+            vocab_index: Word to code mapping, extended in place
             
-        word_freq = pd.Series(words).value_counts(normalize=True)
-        entropy = -sum(word_freq * np.log2(word_freq + 1e-10))
-        return float(entropy)
+        Returns:
+            int64 array of word codes
+        """
+        return np.fromiter((vocab_index.setdefault(word, len(vocab_index)) for word in words),
+                           dtype=np.int64, count=len(words))
+    
+    def _word_counts(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Occurrence count of every distinct word code.
+        
+        Args:
+            codes: Word codes of one response
+            
+        Returns:
+            Strictly positive counts, one per distinct word
+        """
+        counts = np.bincount(codes)
+        return counts[counts > 0]
+    
+    def _entropy_of_counts(self, counts: np.ndarray) -> float:
+        """
+        Shannon entropy of a response from its word counts.
+        
+        Args:
+            counts: Strictly positive word counts (see _word_counts)
+            
+        Returns:
+            Shannon entropy value
+        """
+        if not counts.size:
+            return 0.0
+        return float(ouroboros_kernels.entropy_from_counts(counts))
     
     def detect_phase_markers(self, response: str) -> Dict[str, float]:
         """
@@ -176,15 +468,15 @@ class OuroborosAnalyzer:
         Returns:
             Dictionary of phase scores
         """
-        phase_scores = {}
         response_lower = response.lower()
         
-        for phase, config in self.phase_markers.items():
-            markers = config['markers']
-            score = sum(1 for marker in markers if marker in response_lower)
-            phase_scores[phase] = score / len(markers) if markers else 0
-            
-        return phase_scores
+        # Plain substring checks: for a handful of literals per phase they beat a
+        # compiled regex alternation, and they keep the "marker appears anywhere"
+        # semantics (no word boundaries, each marker counted once)
+        return {
+            phase: sum(marker in response_lower for marker in markers) / n_markers if n_markers else 0
+            for phase, markers, n_markers in self._phase_marker_table
+        }
     
     def detect_cycles(self, metrics_list: List[Dict]) -> Dict:
         """
@@ -200,11 +492,21 @@ class OuroborosAnalyzer:
             return {}
             
         # Extract coherence time series
-        coherence_series = [m['coherence'] for m in metrics_list]
+        coherence_series = np.fromiter((m['coherence'] for m in metrics_list),
+                                       dtype=np.float64, count=len(metrics_list))
+        
+        coherence_std = float(coherence_series.std())
+        
+        # Short or constant series have no meaningful peaks; skip the scans
+        is_degenerate = (coherence_series.size < self.config.get('min_cycle_length', 3)
+                         or coherence_std == 0)
         
         # Find peaks and troughs
-        peaks, peak_properties = signal.find_peaks(coherence_series, distance=2)
-        troughs, trough_properties = signal.find_peaks([-c for c in coherence_series], distance=2)
+        if is_degenerate:
+            peaks = troughs = np.array([], dtype=np.intp)
+        else:
+            peaks, peak_properties = signal.find_peaks(coherence_series, distance=2)
+            troughs, trough_properties = signal.find_peaks(-coherence_series, distance=2)
         
         # Calculate cycle characteristics
         cycles = {
@@ -212,9 +514,9 @@ class OuroborosAnalyzer:
             'num_troughs': len(troughs),
             'peak_positions': peaks.tolist(),
             'trough_positions': troughs.tolist(),
-            'coherence_range': max(coherence_series) - min(coherence_series),
-            'coherence_std': float(np.std(coherence_series)),
-            'coherence_mean': float(np.mean(coherence_series))
+            'coherence_range': float(coherence_series.max() - coherence_series.min()),
+            'coherence_std': coherence_std,
+            'coherence_mean': float(coherence_series.mean())
         }
         
         # Detect phase transitions
@@ -223,9 +525,14 @@ class OuroborosAnalyzer:
         cycles['transition_rate'] = len(phase_transitions) / len(metrics_list) if metrics_list else 0
         
         # Calculate autocorrelation for periodicity
-        if len(coherence_series) > 10:
-            autocorr = np.correlate(coherence_series, coherence_series, mode='full')
-            autocorr = autocorr[len(autocorr)//2:]
+        if coherence_series.size > 10 and coherence_std == 0:
+            # Constant series: the normalized autocorrelation decays linearly, no period
+            cycles['autocorrelation'] = (1.0 - np.arange(10) / coherence_series.size).tolist()
+            cycles['dominant_period'] = None
+        elif coherence_series.size > 10:
+            # FFT-based correlation: O(N log N) instead of np.correlate's O(N^2)
+            autocorr = signal.fftconvolve(coherence_series, coherence_series[::-1], mode='full')
+            autocorr = autocorr[coherence_series.size - 1:]
             autocorr = autocorr / autocorr[0]  # Normalize
             cycles['autocorrelation'] = autocorr[:10].tolist()
             
@@ -256,25 +563,23 @@ class OuroborosAnalyzer:
         Returns:
             List of transition dictionaries
         """
-        transitions = []
-        
-        for i in range(1, len(metrics_list)):
-            prev_phases = metrics_list[i-1]['phase_markers']
-            curr_phases = metrics_list[i]['phase_markers']
-            
-            # Find dominant phase
-            prev_dominant = max(prev_phases, key=prev_phases.get) if prev_phases else 'integration'
-            curr_dominant = max(curr_phases, key=curr_phases.get) if curr_phases else 'integration'
-            
-            if prev_dominant != curr_dominant:
-                transitions.append({
-                    'position': i,
-                    'from_phase': prev_dominant,
-                    'to_phase': curr_dominant,
-                    'coherence_change': metrics_list[i]['coherence'] - metrics_list[i-1]['coherence']
-                })
-                
-        return transitions
+        # Dominant phase index per response
+        dominants = stack_phase_markers(metrics_list).argmax(axis=1)
+        change_positions = np.nonzero(dominants[1:] != dominants[:-1])[0] + 1
+        
+        coherence = np.fromiter((m['coherence'] for m in metrics_list),
+                                dtype=np.float64, count=len(metrics_list))
+        coherence_changes = coherence[change_positions] - coherence[change_positions - 1]
+        
+        return [
+            {
+                'position': int(i),
+                'from_phase': self.phases[dominants[i-1]],
+                'to_phase': self.phases[dominants[i]],
+                'coherence_change': float(change)
+            }
+            for i, change in zip(change_positions, coherence_changes)
+        ]
     
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """
@@ -287,16 +592,7 @@ class OuroborosAnalyzer:
         Returns:
             Similarity score between 0 and 1
         """
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
-        if not words1 or not words2:
-            return 0.0
-            
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        
-        return len(intersection) / len(union) if union else 0
+        return self._jaccard(self._tokenize(text1), self._tokenize(text2))
     
     def track_vocabulary_evolution(self, current: str, previous: List[str]) -> Dict:
         """
@@ -309,12 +605,24 @@ class OuroborosAnalyzer:
         Returns:
             Dictionary of vocabulary evolution metrics
         """
-        current_words = set(current.lower().split())
         all_previous = set()
         
         for prev in previous:
             all_previous.update(prev.lower().split())
             
+        return self._vocabulary_evolution(self._tokenize(current), all_previous)
+    
+    def _vocabulary_evolution(self, current_words: frozenset, all_previous: set) -> Dict:
+        """
+        Vocabulary evolution metrics from precomputed token sets.
+        
+        Args:
+            current_words: Token set of the current response
+            all_previous: Union of all previous token sets
+            
+        Returns:
+            Dictionary of vocabulary evolution metrics
+        """
         return {
             'new_words': len(current_words - all_previous),
             'retained_words': len(current_words.intersection(all_previous)),
@@ -322,12 +630,14 @@ class OuroborosAnalyzer:
             'novelty_ratio': len(current_words - all_previous) / len(current_words) if current_words else 0
         }
     
-    def calculate_session_statistics(self, conversation_data: Dict) -> Dict:
+    def calculate_session_statistics(self, conversation_data: Dict,
+                                     metrics_soa: Optional[Dict[str, np.ndarray]] = None) -> Dict:
         """
         Calculate session-level statistics.
         
         Args:
             conversation_data: Complete conversation data
+            metrics_soa: Per-response metrics as column arrays (built if omitted)
             
         Returns:
             Dictionary of session statistics
@@ -335,132 +645,170 @@ class OuroborosAnalyzer:
         metrics = conversation_data['metrics']
         cycles = conversation_data['cycles']
         
+        if metrics_soa is None:
+            metrics_soa = self._metrics_to_soa(metrics)
+        coherence = metrics_soa['coherence']
+        
+        # The batch scorer already counted the session vocabulary; rebuild it only without one
+        if 'vocab_size' in metrics_soa:
+            total_unique_words = int(metrics_soa['vocab_size'])
+        else:
+            unique_words = set()
+            for response in conversation_data['responses']:
+                unique_words.update(response.lower().split())
+            total_unique_words = len(unique_words)
+        
         stats = {
             'total_responses': len(metrics),
-            'avg_response_length': np.mean([m['length'] for m in metrics]),
-            'total_unique_words': len(set(' '.join(conversation_data['responses']).lower().split())),
-            'coherence_trajectory': 'ascending' if metrics[-1]['coherence'] > metrics[0]['coherence'] else 'descending',
-            'dominant_phase': self._get_dominant_phase(metrics),
-            'phase_distribution': self._calculate_phase_distribution(metrics),
+            'avg_response_length': metrics_soa['length'].mean(),
+            'total_unique_words': total_unique_words,
+            'coherence_trajectory': 'ascending' if coherence[-1] > coherence[0] else 'descending',
+            'dominant_phase': self._dominant_phase(metrics_soa['phase_vec']),
+            'phase_distribution': self._phase_distribution(metrics_soa['phase_vec']),
             'cycle_completeness': cycles['num_peaks'] / (len(metrics) / 4) if len(metrics) > 0 else 0
         }
         
         return stats
     
-    def _calculate_coherence(self, response: str) -> float:
+    def _tokenize(self, text: str) -> frozenset:
         """
-        Calculate coherence score for a response.
-        Stub implementation - replace with TIDE coherence calculation.
+        Lowercased word set of a response.
         
         Args:
-            response: Response text
+            text: Response text
             
         Returns:
-            Coherence score
+            Frozen set of words
         """
-        if self.tide:
-            return self.tide.calculate_coherence(response)
-        else:
-            # Simple proxy: normalized sentence count and average sentence length
-            sentences = response.split('.')
-            if len(sentences) == 0:
-                return 0.0
-            avg_length = np.mean([len(s.split()) for s in sentences if s.strip()])
-            return min(1.0, (len(sentences) * avg_length) / 100)
+        return frozenset(text.lower().split())
     
-    def _calculate_lexical_diversity(self, text: str) -> float:
+    def _jaccard(self, words1: frozenset, words2: frozenset) -> float:
         """
-        Calculate lexical diversity (type-token ratio).
+        Jaccard similarity between two precomputed word sets.
         
         Args:
-            text: Response text
+            words1: First word set
+            words2: Second word set
             
         Returns:
-            Lexical diversity score
+            Similarity score between 0 and 1
         """
-        words = text.lower().split()
-        if not words:
+        if not words1 or not words2:
             return 0.0
-        return len(set(words)) / len(words)
+            
+        return len(words1 & words2) / len(words1 | words2)
     
-    def _calculate_semantic_drift(self, current: str, previous: List[str]) -> float:
+    def _encode_tokens(self, words: frozenset, vocab_index: Dict[str, int]) -> int:
         """
-        Calculate semantic drift from conversation beginning.
+        Encode a word set as a bitset over the session vocabulary.
         
         Args:
-            current: Current response
-            previous: Previous responses
+            words: Word set of a response
+            vocab_index: Word to bit position mapping, extended in place
+            
+        Returns:
+            Integer with one bit set per word
+        """
+        bits = 0
+        for word in words:
+            bits |= 1 << vocab_index.setdefault(word, len(vocab_index))
+        return bits
+    
+    def _jaccard_bits(self, bits1: int, bits2: int) -> float:
+        """
+        Jaccard similarity between two token bitsets.
+        
+        Args:
+            bits1: First bitset
+            bits2: Second bitset
             
         Returns:
-            Drift score
+            Similarity score between 0 and 1
         """
-        if not previous:
+        if not bits1 or not bits2:
             return 0.0
             
-        first_response = previous[0]
-        return 1.0 - self.calculate_similarity(current, first_response)
+        return _popcount(bits1 & bits2) / _popcount(bits1 | bits2)
     
-    def _get_dominant_phase(self, metrics: List[Dict]) -> str:
+    def _calculate_coherence(self, response: str) -> float:
         """
-        Get the most dominant phase across all responses.
+        Calculate coherence score for a response.
+        Stub implementation - replace with TIDE coherence calculation.
         
         Args:
-            metrics: List of metrics
+            response: Response text
             
         Returns:
-            Name of dominant phase
+            Coherence score
         """
-        phase_totals = {phase: 0 for phase in self.phases}
+        if self.tide:
+            return self.tide.calculate_coherence(response)
+        else:
+            # Simple proxy: normalized sentence count and average sentence length
+            sentences = response.split('.')
+            if len(sentences) == 0:
+                return 0.0
+            avg_length = np.mean([len(s.split()) for s in sentences if s.strip()])
+            return min(1.0, (len(sentences) * avg_length) / 100)
+    
+    def _dominant_phase(self, phase_matrix: np.ndarray) -> str:
+        """
+        Phase with the highest total score in an (N, 4) phase matrix.
         
-        for m in metrics:
-            if 'phase_markers' in m:
-                for phase, score in m['phase_markers'].items():
-                    phase_totals[phase] += score
-                    
-        return max(phase_totals, key=phase_totals.get)
+        Args:
+            phase_matrix: Phase scores, one row per response
+            
+        Returns:
+            Name of dominant phase
+        """
+        return self.phases[phase_matrix.sum(axis=0).argmax()]
     
-    def _calculate_phase_distribution(self, metrics: List[Dict]) -> Dict[str, float]:
+    def _phase_distribution(self, phase_matrix: np.ndarray) -> Dict[str, float]:
         """
-        Calculate distribution of phases across conversation.
+        Share of responses dominated by each phase in an (N, 4) phase matrix.
         
         Args:
-            metrics: List of metrics
+            phase_matrix: Phase scores, one row per response
             
         Returns:
             Phase distribution dictionary
         """
-        phase_counts = {phase: 0 for phase in self.phases}
-        
-        for m in metrics:
-            if 'phase_markers' in m:
-                dominant = max(m['phase_markers'], key=m['phase_markers'].get)
-                phase_counts[dominant] += 1
-                
-        total = sum(phase_counts.values())
+        phase_counts = np.bincount(phase_matrix.argmax(axis=1), minlength=len(self.phases))
+        total = len(phase_matrix)
         
-        return {phase: count/total if total > 0 else 0 
-                for phase, count in phase_counts.items()}
+        return {phase: int(count)/total if total > 0 else 0 
+                for phase, count in zip(self.phases, phase_counts)}
     
-    def _save_intermediate_results(self, sessions: List[Dict], model_name: str):
+    def _new_checkpoint_file(self, model_name: str) -> str:
         """
-        Save intermediate results to prevent data loss.
+        Path of a fresh append-only checkpoint file for one collection run.
         
         Args:
-            sessions: List of session data
             model_name: Name of the model
+            
+        Returns:
+            Checkpoint filename
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f'data/intermediate_{model_name}_{timestamp}.json'
-        
         os.makedirs('data', exist_ok=True)
+        return f'data/intermediate_{model_name}_{timestamp}.jsonl'
+    
+    def _save_intermediate_results(self, session: Dict, filename: str):
+        """
+        Append a completed session to the JSON-lines checkpoint to prevent data loss.
         
-        with open(filename, 'w') as f:
-            json.dump(sessions, f, indent=2, default=str)
-            
-        print(f"    💾 Saved intermediate results: {filename}")
+        Args:
+            session: Session data
+            filename: Checkpoint file for the current collection run
+        """
+        line = serialize_json(session) + b'\n'
+        
+        with self._save_lock, open(filename, 'ab') as f:
+            f.write(line)
     
     def _get_model_response(self, model_name: str, prompt: str, 
-                           conversation_history: List[str]) -> str:
+                           conversation_history: List[str],
+                           session_id: Optional[int] = None) -> str:
         """
         Get REAL response from ACTUAL model via API.
         
@@ -468,10 +816,16 @@ class OuroborosAnalyzer:
             model_name: Model to query
             prompt: Current prompt
             conversation_history: Previous responses
+            session_id: Session the call belongs to (keeps cached sessions distinct)
             
         Returns:
             REAL model response (DATA-DRIVEN, NOT SYNTHETIC!)
         """
+        cache_key = self._response_cache_key(model_name, prompt, conversation_history, session_id)
+        cached = self._load_cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # Import the real API integration
             from api_integration import get_real_model_response
@@ -480,7 +834,8 @@ class OuroborosAnalyzer:
             response = get_real_model_response(model_name, prompt, conversation_history)
             
             # Ensure we got a valid response
-            if response and not response.startswith("Error"):
+            if not _is_api_error(response):
+                self._store_cached_response(cache_key, response)
                 return response
             else:
                 print(f"⚠️ API issue, using fallback for {model_name}: {response}")
@@ -491,3 +846,83 @@ class OuroborosAnalyzer:
             print("⚠️ API integration not found, using stub responses")
             # Only use stub if api_integration.py doesn't exist
             return f"Stub response for: {prompt[:50]}..."
+    
+    async def _get_model_response_async(self, model_name: str, prompt: str,
+                                        conversation_history: List[str],
+                                        session_id: Optional[int] = None) -> str:
+        """
+        Awaitable _get_model_response; the blocking API clients run in the default executor.
+        
+        Args:
+            model_name: Model to query
+            prompt: Current prompt
+            conversation_history: Previous responses
+            session_id: Session the call belongs to
+            
+        Returns:
+            Model response
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._get_model_response, model_name, prompt, list(conversation_history), session_id
+        )
+    
+    def _response_cache_key(self, model_name: str, prompt: str,
+                            conversation_history: List[str],
+                            session_id: Optional[int] = None) -> Optional[str]:
+        """
+        Build the response cache key for a model call.
+        
+        Every session sends the same prompt sequence, so the session id is part
+        of the key; otherwise sessions 1..N would replay session 0's responses.
+        
+        Args:
+            model_name: Model to query
+            prompt: Current prompt
+            conversation_history: Previous responses
+            session_id: Session the call belongs to
+            
+        Returns:
+            Hex digest key, or None when caching is disabled
+        """
+        if not self._response_cache_dir:
+            return None
+        
+        history = '\x00'.join(conversation_history)
+        payload = f"{model_name}|{session_id}|{prompt}|{history}".encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _load_cached_response(self, cache_key: Optional[str]) -> Optional[str]:
+        """
+        Look up a cached response.
+        
+        Args:
+            cache_key: Key from _response_cache_key
+            
+        Returns:
+            Cached response, or None on a miss
+        """
+        if cache_key is None:
+            return None
+        
+        with self._cache_lock, shelve.open(self._response_cache_path()) as cache:
+            return cache.get(cache_key)
+    
+    def _store_cached_response(self, cache_key: Optional[str], response: str):
+        """
+        Persist a model response in the cache.
+        
+        Args:
+            cache_key: Key from _response_cache_key
+            response: Model response
+        """
+        if cache_key is None:
+            return
+        
+        with self._cache_lock, shelve.open(self._response_cache_path()) as cache:
+            cache[cache_key] = response
+    
+    def _response_cache_path(self) -> str:
+        """Path of the shelve database inside the cache directory."""
+        os.makedirs(self._response_cache_dir, exist_ok=True)
+        return os.path.join(self._response_cache_dir, 'model_responses')
@@ -0,0 +1,168 @@
+# ouroboros_kernels.py
+"""
+Compiled numerical kernels for Ouroboros metrics
+Hillary Danan - August 2025
+<4577> <45774EVER
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def entropy_from_counts(counts: np.ndarray) -> float:
+        """
+        Shannon entropy (bits) of a vector of strictly positive counts.
+
+        Args:
+            counts: 1-D array of token counts
+
+        Returns:
+            Shannon entropy value
+        """
+        total = 0.0
+        for c in counts:
+            total += c
+        if total == 0.0:
+            return 0.0
+
+        entropy = 0.0
+        for c in counts:
+            p = c / total
+            entropy -= p * np.log2(p)
+        return entropy
+else:
+    def entropy_from_counts(counts: np.ndarray) -> float:
+        """
+        Shannon entropy (bits) of a vector of strictly positive counts.
+
+        Without numba the scalar loop above runs ~20x slower than this vectorized form.
+
+        Args:
+            counts: 1-D array of token counts
+
+        Returns:
+            Shannon entropy value
+        """
+        total = counts.sum()
+        if total == 0:
+            return 0.0
+        p = counts / total
+        return float(-(p * np.log2(p)).sum())
+
+
+@njit(cache=True)
+def batch_cycle_position(coherence: np.ndarray, entropy: np.ndarray) -> np.ndarray:
+    """
+    Elementwise TIDE cycle-position heuristic (see TIDEOuroborosAdapter._estimate_cycle_position).
+
+    Args:
+        coherence: 1-D array of coherence scores
+        entropy: 1-D array of entropy scores
+
+    Returns:
+        Estimated cycle positions (0-1)
+    """
+    positions = np.empty(coherence.shape[0], dtype=np.float64)
+    for i in range(coherence.shape[0]):
+        c = coherence[i]
+        e = entropy[i]
+        if c > 0.7 and e < 0.3:
+            positions[i] = 0.125  # Integration
+        elif c < 0.4 and e > 0.6:
+            positions[i] = 0.375  # Consumption
+        elif c > 0.5 and e > 0.5:
+            positions[i] = 0.625  # Transformation
+        else:
+            positions[i] = 0.875  # Generation
+    return positions
+
+
+@njit(cache=True)
+def batch_transformation_potential(entropy: np.ndarray, novelty: np.ndarray,
+                                   drift: np.ndarray) -> np.ndarray:
+    """
+    Elementwise mean of entropy, vocabulary novelty and semantic drift.
+
+    Args:
+        entropy: 1-D array of entropy scores
+        novelty: 1-D array of novelty ratios
+        drift: 1-D array of semantic drift scores
+
+    Returns:
+        Transformation potentials
+    """
+    potentials = np.empty(entropy.shape[0], dtype=np.float64)
+    for i in range(entropy.shape[0]):
+        potentials[i] = (entropy[i] + novelty[i] + drift[i]) / 3
+    return potentials
+
+
+@njit(cache=True, nogil=True)
+def synthetic_coherence_steps(base_coherence, deltas_int, deltas_cons, deltas_trans,
+                              deltas_gen_big, deltas_gen_small, noise, transitions):
+    """
+    Synthetic ouroboros coherence recurrence over a batch of sessions.
+
+    Args:
+        base_coherence: Starting coherence for every session
+        deltas_int, deltas_cons, deltas_trans: Pre-drawn per-phase deltas, (n_sessions, length)
+        deltas_gen_big, deltas_gen_small: Generation deltas for every 4th / other positions
+        noise: Model noise added after the phase update
+        transitions: Boolean phase-advance decisions
+
+    Returns:
+        Tuple of (coherence history float64, phase index history int8)
+    """
+    n_sessions, length = noise.shape
+    coherence_history = np.empty((n_sessions, length), dtype=np.float64)
+    phase_history = np.empty((n_sessions, length), dtype=np.int8)
+
+    for s in range(n_sessions):
+        coherence = base_coherence
+        phase_idx = 0
+        for i in range(length):
+            phase = phase_idx % 4
+            phase_history[s, i] = phase
+
+            if phase == 0:  # Integration - increases
+                coherence = min(1.0, coherence + deltas_int[s, i])
+            elif phase == 1:  # Consumption - decreases
+                coherence = max(0.1, coherence + deltas_cons[s, i])
+            elif phase == 2:  # Transformation - high variance
+                coherence = min(1.0, max(0.1, coherence + deltas_trans[s, i]))
+            else:  # Generation - rapid increase every 4th position, then stabilization
+                if i % 4 == 0:
+                    coherence = min(1.0, coherence + deltas_gen_big[s, i])
+                else:
+                    coherence = min(1.0, coherence + deltas_gen_small[s, i])
+
+            # Model-specific noise
+            coherence += noise[s, i]
+            if coherence < 0.0:
+                coherence = 0.0
+            elif coherence > 1.0:
+                coherence = 1.0
+            coherence_history[s, i] = coherence
+
+            if transitions[s, i]:
+                phase_idx += 1
+
+    return coherence_history, phase_history
+
+
+def warmup():
+    """Trigger JIT compilation so the first analyzed response isn't penalized."""
+    entropy_from_counts(np.ones(2, dtype=np.int64))
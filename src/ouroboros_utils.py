@@ -0,0 +1,28 @@
+# ouroboros_utils.py
+"""
+Shared array helpers for Ouroboros metrics
+Hillary Danan - August 2025
+<4577> <45774EVER
+"""
+
+import numpy as np
+from typing import Dict, Sequence
+from config import PHASES
+
+
+def stack_phase_markers(metrics: Sequence[Dict]) -> np.ndarray:
+    """
+    Stack per-response phase marker scores into an (N, len(PHASES)) array, columns in PHASES order.
+    
+    Args:
+        metrics: Sequence of metrics dictionaries
+        
+    Returns:
+        float64 phase score matrix (zero rows where markers are missing or empty)
+    """
+    stacked = np.zeros((len(metrics), len(PHASES)), dtype=np.float64)
+    for i, m in enumerate(metrics):
+        markers = m.get('phase_markers')
+        if markers:
+            stacked[i] = [markers.get(phase, 0) for phase in PHASES]
+    return stacked
@@ -5,16 +5,93 @@ Hillary Danan - August 2025
 <4577> <45774EVER
 """
 
+import os
+import sys
+import matplotlib
+
+# Figures here are written to files; use the non-GUI backend unless the user chose one
+# (or pyplot is already set up, e.g. in a notebook)
+if os.environ.get('MPLBACKEND') is None and 'matplotlib.pyplot' not in sys.modules:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-import seaborn as sns
-from matplotlib.patches import Rectangle
-import plotly.graph_objects as go
-import plotly.express as px
+from matplotlib.colors import ListedColormap
 import numpy as np
-import pandas as pd
-from typing import Dict, List, Optional
-from config import OUROBOROS_CONFIG
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
+from config import OUROBOROS_CONFIG, PHASES
+from ouroboros_utils import stack_phase_markers
+
+# plotly is imported where it is used, so static-only users skip it
+if TYPE_CHECKING:
+    import pandas as pd
+    import plotly.graph_objects as go
+
+# Bar colors for the per-model comparison panels
+_MODEL_BAR_COLORS = ('#667eea', '#ff6b6b', '#ffd93d')
+
+# seaborn's default 6-color "husl" palette, set as the matplotlib color cycle without importing seaborn
+_HUSL_PALETTE = ('#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4')
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    
+    Args:
+        x: Monotonic x values
+        y: Series values
+        n_out: Number of points to keep
+        
+    Returns:
+        Sorted indices of the points to keep (first and last always included)
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0], indices[-1] = 0, n - 1
+    
+    selected = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start = end
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+        
+        # Pick the point forming the largest triangle with the previous pick and next bucket's mean
+        area = np.abs((x[selected] - avg_x) * (y[start:end] - y[selected])
+                      - (x[selected] - x[start:end]) * (avg_y - y[selected]))
+        selected = start + int(np.argmax(area))
+        indices[i + 1] = selected
+        
+    return indices
+
+def _render_session(args) -> str:
+    """
+    Render and save the coherence cycle plot for one session (process-pool worker).
+    
+    Args:
+        args: Tuple of (session data, output directory)
+        
+    Returns:
+        Saved plot filename
+    """
+    session, out_dir = args
+    fig = OuroborosVisualizer().plot_coherence_cycles(session)
+    plot_filename = str(Path(out_dir) / 
+                        f"ouroboros_{session.get('model', 'Unknown')}_session{session.get('session_id', 0)}.png")
+    fig.savefig(plot_filename, dpi=150, bbox_inches='tight')
+    plt.close(fig)
+    return plot_filename
+
 
 class OuroborosVisualizer:
     """
@@ -27,13 +104,21 @@ class OuroborosVisualizer:
             phase: config['color'] 
             for phase, config in OUROBOROS_CONFIG['phases'].items()
         }
+        self.phase_cmap = ListedColormap([self.phase_colors[phase] for phase in PHASES])
+        
+        # Node positions for the phase transition network (circular layout)
+        theta = np.linspace(0, 2*np.pi, len(PHASES), endpoint=False)
+        self._phase_pos = {phase: (np.cos(t), np.sin(t)) for phase, t in zip(PHASES, theta)}
+        
+        # (metrics list, arrays) of the most recently plotted session only
+        self._last_arrays = None
         
         # Set style
         try:
             plt.style.use('seaborn-v0_8-darkgrid')
         except:
             plt.style.use('default')
-        sns.set_palette("husl")
+        plt.rcParams['axes.prop_cycle'] = plt.cycler(color=_HUSL_PALETTE)
         
     def plot_coherence_cycles(self, session_data: Dict) -> plt.Figure:
         """
@@ -48,27 +133,28 @@ class OuroborosVisualizer:
         fig, (ax1, ax2, ax3, ax4) = plt.subplots(4, 1, figsize=(14, 12), sharex=True)
         
         # Extract data
-        positions = [m['position'] for m in session_data['metrics']]
-        coherence = [m['coherence'] for m in session_data['metrics']]
-        entropy = [m['entropy'] for m in session_data['metrics']]
+        arrays = self._get_arrays(session_data)
+        positions = arrays['position']
+        coherence = arrays['coherence']
+        entropy = arrays['entropy']
         
         # Plot 1: Coherence with cycles
-        ax1.plot(positions, coherence, 'b-', linewidth=2.5, label='Coherence', alpha=0.8)
+        coherence_line, = ax1.plot(positions, coherence, 'b-', linewidth=2.5, label='Coherence', alpha=0.8)
         
         # Mark peaks and troughs
         if 'peak_positions' in session_data['cycles']:
-            peak_pos = session_data['cycles']['peak_positions']
-            if peak_pos:
-                ax1.scatter(peak_pos, 
-                           [coherence[i] for i in peak_pos if i < len(coherence)], 
+            peaks = np.asarray(session_data['cycles']['peak_positions'], dtype=np.int64)
+            peaks = peaks[peaks < coherence.size]
+            if peaks.size:
+                ax1.scatter(peaks, coherence[peaks], 
                            color='green', s=150, zorder=5, label='Peaks', 
                            marker='^', edgecolors='darkgreen', linewidth=2)
                 
         if 'trough_positions' in session_data['cycles']:
-            trough_pos = session_data['cycles']['trough_positions']
-            if trough_pos:
-                ax1.scatter(trough_pos,
-                           [coherence[i] for i in trough_pos if i < len(coherence)], 
+            troughs = np.asarray(session_data['cycles']['trough_positions'], dtype=np.int64)
+            troughs = troughs[troughs < coherence.size]
+            if troughs.size:
+                ax1.scatter(troughs, coherence[troughs], 
                            color='red', s=150, zorder=5, label='Troughs',
                            marker='v', edgecolors='darkred', linewidth=2)
         
@@ -83,20 +169,19 @@ class OuroborosVisualizer:
         ax1.set_title('Coherence Cycles', fontsize=14, fontweight='bold')
         
         # Plot 2: Entropy
-        ax2.plot(positions, entropy, 'r-', linewidth=2, label='Shannon Entropy', alpha=0.8)
+        entropy_line, = ax2.plot(positions, entropy, 'r-', linewidth=2, label='Shannon Entropy', alpha=0.8)
         ax2.fill_between(positions, entropy, alpha=0.3, color='red')
         ax2.set_ylabel('Shannon Entropy', fontsize=12, fontweight='bold')
         ax2.legend(loc='upper right', framealpha=0.9)
         ax2.grid(True, alpha=0.3)
         ax2.set_title('Information Entropy', fontsize=14, fontweight='bold')
         
-        # Plot 3: Phase dominance over time
-        for i, metrics in enumerate(session_data['metrics']):
-            if 'phase_markers' in metrics:
-                dominant_phase = max(metrics['phase_markers'], key=metrics['phase_markers'].get)
-                color = self.phase_colors[dominant_phase]
-                ax3.add_patch(Rectangle((i-0.45, 0), 0.9, 1, 
-                                       facecolor=color, alpha=0.7, edgecolor='black', linewidth=0.5))
+        # Plot 3: Phase dominance over time, one image strip instead of a patch per response
+        phase_idx = np.ma.masked_less(arrays['dominant_phase'], 0)
+        if phase_idx.size:
+            ax3.imshow(phase_idx[np.newaxis, :], aspect='auto', cmap=self.phase_cmap,
+                       vmin=0, vmax=len(PHASES) - 1, extent=(-0.5, phase_idx.size - 0.5, 0, 1),
+                       interpolation='nearest', alpha=0.7)
         
         # Add phase transitions
         if 'phase_transitions' in session_data['cycles']:
@@ -116,8 +201,8 @@ class OuroborosVisualizer:
         
         # Plot 4: Similarity measures
         if len(session_data['metrics']) > 1:
-            similarity_to_first = [m.get('similarity_to_first', 0) for m in session_data['metrics'][1:]]
-            similarity_to_prev = [m.get('similarity_to_previous', 0) for m in session_data['metrics'][1:]]
+            similarity_to_first = arrays['similarity_to_first'][1:]
+            similarity_to_prev = arrays['similarity_to_previous'][1:]
             
             ax4.plot(positions[1:], similarity_to_first, 'g-', linewidth=2, 
                     label='Similarity to First', alpha=0.8)
@@ -129,6 +214,11 @@ class OuroborosVisualizer:
             ax4.grid(True, alpha=0.3)
             ax4.set_title('Semantic Drift', fontsize=14, fontweight='bold')
         
+        # Long series are stored as raster tiles in PDF/SVG output
+        coherence_line.set_rasterized(True)
+        entropy_line.set_rasterized(True)
+        fig.set_dpi(100)
+        
         # Overall title
         model_name = session_data.get('model', 'Unknown')
         session_id = session_data.get('session_id', 0)
@@ -138,42 +228,137 @@ class OuroborosVisualizer:
         plt.tight_layout()
         return fig
     
-    def create_interactive_cycle_plot(self, session_data: Dict) -> go.Figure:
+    def render_all_sessions(self, sessions: List[Dict], out_dir: str,
+                            max_workers: Optional[int] = None) -> List[str]:
+        """
+        Save a coherence cycle plot for every session, one figure per worker process.
+        
+        Args:
+            sessions: List of session data
+            out_dir: Directory to write PNG files into
+            max_workers: Worker processes (defaults to the CPU count)
+            
+        Returns:
+            Saved plot filenames, in session order
+        """
+        if not sessions:
+            return []
+        
+        Path(out_dir).mkdir(parents=True, exist_ok=True)
+        jobs = [(session, out_dir) for session in sessions]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_render_session, jobs, chunksize=4))
+    
+    def _get_arrays(self, session_data: Dict) -> Dict[str, np.ndarray]:
+        """
+        Metric arrays for a session, reused while the same session is plotted repeatedly.
+        
+        Only the most recent session is kept, so the visualizer never pins a
+        whole corpus; kept off session_data so sessions still serialize cleanly.
+        The cache is keyed on the metrics list object, so pass a new list
+        (not an in-place edit) when a session's metrics change between plots.
+        
+        Args:
+            session_data: Single session data dictionary
+            
+        Returns:
+            Dictionary of metric arrays (see _metrics_to_arrays)
+        """
+        metrics = session_data['metrics']
+        cached = self._last_arrays
+        if cached is None or cached[0] is not metrics or len(cached[1]['position']) != len(metrics):
+            cached = (metrics, self._metrics_to_arrays(metrics))
+            self._last_arrays = cached
+        return cached[1]
+    
+    def _metrics_to_arrays(self, metrics: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        Extract per-response metric columns as NumPy arrays.
+        
+        Args:
+            metrics: List of per-response metric dictionaries
+            
+        Returns:
+            Dictionary of float64 arrays plus an int8 'dominant_phase' array
+            indexing PHASES (-1 where a response has no phase markers)
+        """
+        n = len(metrics)
+        arrays = {
+            'position': np.fromiter((m['position'] for m in metrics), dtype=np.float64, count=n),
+            'coherence': np.fromiter((m['coherence'] for m in metrics), dtype=np.float64, count=n),
+            'entropy': np.fromiter((m['entropy'] for m in metrics), dtype=np.float64, count=n),
+            'similarity_to_first': np.fromiter(
+                (m.get('similarity_to_first', 0) for m in metrics), dtype=np.float64, count=n
+            ),
+            'similarity_to_previous': np.fromiter(
+                (m.get('similarity_to_previous', 0) for m in metrics), dtype=np.float64, count=n
+            ),
+        }
+        
+        # Stack phase scores once; argmax keeps max()'s first-in-PHASES tie-break
+        has_markers = np.fromiter(('phase_markers' in m for m in metrics), dtype=bool, count=n)
+        phase_scores = stack_phase_markers(metrics)
+        
+        dominant_phase = np.argmax(phase_scores, axis=1).astype(np.int8)
+        dominant_phase[~has_markers] = -1
+        arrays['dominant_phase'] = dominant_phase
+        
+        return arrays
+    
+    def create_interactive_cycle_plot(self, session_data: Dict, max_points: int = 2000,
+                                      dynamic_resampling: bool = False) -> 'go.Figure':
         """
         Create interactive Plotly visualization of cycles.
         
         Args:
             session_data: Single session data dictionary
+            max_points: Traces longer than this are LTTB-downsampled before plotting
+            dynamic_resampling: Return a plotly-resampler FigureResampler holding the
+                full-resolution traces, re-aggregated on zoom. Zoom callbacks need a
+                Dash server (fig.show_dash()) or JupyterLab; exported HTML stays static.
+                Falls back to static LTTB if plotly-resampler is not installed.
             
         Returns:
             Plotly figure
         """
-        metrics = session_data['metrics']
+        import plotly.graph_objects as go
         
-        # Create figure with secondary y-axis
-        fig = go.Figure()
+        arrays = self._get_arrays(session_data)
+        positions = arrays['position']
+        coherence_values = arrays['coherence']
         
-        # Add coherence trace
-        fig.add_trace(go.Scatter(
-            x=[m['position'] for m in metrics],
-            y=[m['coherence'] for m in metrics],
+        # WebGL traces keep long sessions responsive in the browser
+        coherence_style = dict(
             mode='lines+markers',
             name='Coherence',
             line=dict(color='blue', width=3),
             marker=dict(size=8),
             hovertemplate='Position: %{x}<br>Coherence: %{y:.3f}<extra></extra>'
-        ))
-        
-        # Add entropy trace
-        fig.add_trace(go.Scatter(
-            x=[m['position'] for m in metrics],
-            y=[m['entropy'] for m in metrics],
+        )
+        entropy_style = dict(
             mode='lines',
             name='Entropy',
             yaxis='y2',
             line=dict(color='red', width=2),
             hovertemplate='Position: %{x}<br>Entropy: %{y:.3f}<extra></extra>'
-        ))
+        )
+        
+        # Create figure with secondary y-axis
+        fig = self._new_resampled_figure(max_points) if dynamic_resampling else None
+        if fig is not None:
+            fig.add_trace(go.Scattergl(**coherence_style), hf_x=positions, hf_y=coherence_values)
+            fig.add_trace(go.Scattergl(**entropy_style), hf_x=positions, hf_y=arrays['entropy'])
+        else:
+            coherence_idx = _lttb_indices(positions, coherence_values, max_points)
+            entropy_idx = _lttb_indices(positions, arrays['entropy'], max_points)
+            
+            fig = go.Figure()
+            fig.add_trace(go.Scattergl(
+                x=positions[coherence_idx], y=coherence_values[coherence_idx], **coherence_style
+            ))
+            fig.add_trace(go.Scattergl(
+                x=positions[entropy_idx], y=arrays['entropy'][entropy_idx], **entropy_style
+            ))
         
         # Mark phase transitions with vertical lines
         if 'phase_transitions' in session_data['cycles']:
@@ -188,9 +373,8 @@ class OuroborosVisualizer:
         
         # Mark peaks and troughs
         if 'peak_positions' in session_data['cycles']:
-            coherence_values = [m['coherence'] for m in metrics]
             for peak in session_data['cycles']['peak_positions']:
-                if peak < len(coherence_values):
+                if peak < coherence_values.size:
                     fig.add_annotation(
                         x=peak, y=coherence_values[peak],
                         text="🔺", showarrow=False,
@@ -198,9 +382,8 @@ class OuroborosVisualizer:
                     )
         
         if 'trough_positions' in session_data['cycles']:
-            coherence_values = [m['coherence'] for m in metrics]
             for trough in session_data['cycles']['trough_positions']:
-                if trough < len(coherence_values):
+                if trough < coherence_values.size:
                     fig.add_annotation(
                         x=trough, y=coherence_values[trough],
                         text="🔻", showarrow=False,
@@ -237,7 +420,25 @@ class OuroborosVisualizer:
         
         return fig
     
-    def plot_model_comparison(self, model_stats_df: pd.DataFrame) -> plt.Figure:
+    def _new_resampled_figure(self, max_points: int) -> Optional['go.Figure']:
+        """
+        Empty plotly-resampler figure, or None if plotly-resampler is not installed.
+        
+        Args:
+            max_points: Samples shown per trace at any zoom level
+            
+        Returns:
+            FigureResampler instance or None
+        """
+        try:
+            import plotly.graph_objects as go
+            from plotly_resampler import FigureResampler
+        except ImportError:
+            print("⚠️ plotly-resampler not installed, using static LTTB downsampling")
+            return None
+        return FigureResampler(go.Figure(), default_n_shown_samples=max_points)
+    
+    def plot_model_comparison(self, model_stats_df: 'pd.DataFrame') -> plt.Figure:
         """
         Compare ouroboros patterns across models.
         
@@ -251,28 +452,35 @@ class OuroborosVisualizer:
         fig.suptitle('🐍 Ouroboros Pattern Comparison Across Models ♾️', 
                     fontsize=16, fontweight='bold')
         
-        models = model_stats_df['model'].values
+        models = model_stats_df['model'].to_numpy()
+        
+        # Pull each plotted column out of the frame once
+        stats = {
+            column: model_stats_df[column].to_numpy(dtype=np.float64, copy=False)
+            for column in ('avg_cycles', 'std_cycles', 'avg_cycle_amplitude', 'avg_coherence',
+                           'phase_transition_rate', 'avg_cycle_regularity')
+        }
         
         # Plot 1: Average cycles
-        axes[0, 0].bar(models, model_stats_df['avg_cycles'], 
-                      color=['#667eea', '#ff6b6b', '#ffd93d'], alpha=0.8, edgecolor='black')
-        axes[0, 0].errorbar(models, model_stats_df['avg_cycles'], 
-                           yerr=model_stats_df['std_cycles'], 
+        axes[0, 0].bar(models, stats['avg_cycles'], 
+                      color=_MODEL_BAR_COLORS, alpha=0.8, edgecolor='black')
+        axes[0, 0].errorbar(models, stats['avg_cycles'], 
+                           yerr=stats['std_cycles'], 
                            fmt='none', color='black', capsize=5)
         axes[0, 0].set_title('Average Number of Cycles', fontweight='bold')
         axes[0, 0].set_ylabel('Cycles per Conversation')
         axes[0, 0].grid(True, alpha=0.3)
         
         # Plot 2: Cycle amplitude
-        axes[0, 1].bar(models, model_stats_df['avg_cycle_amplitude'],
-                      color=['#667eea', '#ff6b6b', '#ffd93d'], alpha=0.8, edgecolor='black')
+        axes[0, 1].bar(models, stats['avg_cycle_amplitude'],
+                      color=_MODEL_BAR_COLORS, alpha=0.8, edgecolor='black')
         axes[0, 1].set_title('Average Cycle Amplitude', fontweight='bold')
         axes[0, 1].set_ylabel('Coherence Range')
         axes[0, 1].grid(True, alpha=0.3)
         
         # Plot 3: Coherence comparison
-        axes[0, 2].bar(models, model_stats_df['avg_coherence'],
-                      color=['#667eea', '#ff6b6b', '#ffd93d'], alpha=0.8, edgecolor='black')
+        axes[0, 2].bar(models, stats['avg_coherence'],
+                      color=_MODEL_BAR_COLORS, alpha=0.8, edgecolor='black')
         axes[0, 2].set_title('Average Coherence', fontweight='bold')
         axes[0, 2].set_ylabel('Coherence Score')
         axes[0, 2].grid(True, alpha=0.3)
@@ -285,15 +493,15 @@ class OuroborosVisualizer:
                                   color='red', linestyle='--', alpha=0.5)
         
         # Plot 4: Phase distribution (stacked bar)
-        phases = ['integration', 'consumption', 'transformation', 'generation']
-        phase_data = model_stats_df[[f'{p}_dominance' for p in phases]].values
+        phase_columns = [f'{p}_dominance' for p in PHASES]
+        phase_data = model_stats_df[phase_columns].to_numpy(dtype=np.float32, copy=False)
         
         bottom = np.zeros(len(models))
-        for i, phase in enumerate(phases):
-            axes[1, 0].bar(models, phase_data[:, i], bottom=bottom, 
+        for phase, phase_values in zip(PHASES, phase_data.T):
+            axes[1, 0].bar(models, phase_values, bottom=bottom, 
                           label=phase.capitalize(), color=self.phase_colors[phase], 
                           alpha=0.8, edgecolor='black')
-            bottom += phase_data[:, i]
+            bottom += phase_values
         
         axes[1, 0].set_title('Phase Distribution', fontweight='bold')
         axes[1, 0].set_ylabel('Proportion')
@@ -301,15 +509,15 @@ class OuroborosVisualizer:
         axes[1, 0].grid(True, alpha=0.3)
         
         # Plot 5: Transition rate
-        axes[1, 1].bar(models, model_stats_df['phase_transition_rate'],
-                      color=['#667eea', '#ff6b6b', '#ffd93d'], alpha=0.8, edgecolor='black')
+        axes[1, 1].bar(models, stats['phase_transition_rate'],
+                      color=_MODEL_BAR_COLORS, alpha=0.8, edgecolor='black')
         axes[1, 1].set_title('Phase Transition Rate', fontweight='bold')
         axes[1, 1].set_ylabel('Transitions per Response')
         axes[1, 1].grid(True, alpha=0.3)
         
         # Plot 6: Cycle regularity
-        axes[1, 2].bar(models, model_stats_df['avg_cycle_regularity'],
-                      color=['#667eea', '#ff6b6b', '#ffd93d'], alpha=0.8, edgecolor='black')
+        axes[1, 2].bar(models, stats['avg_cycle_regularity'],
+                      color=_MODEL_BAR_COLORS, alpha=0.8, edgecolor='black')
         axes[1, 2].set_title('Cycle Regularity', fontweight='bold')
         axes[1, 2].set_ylabel('Standard Deviation (lower = more regular)')
         axes[1, 2].grid(True, alpha=0.3)
@@ -317,7 +525,7 @@ class OuroborosVisualizer:
         plt.tight_layout()
         return fig
     
-    def create_phase_transition_network(self, sessions: List[Dict]) -> go.Figure:
+    def create_phase_transition_network(self, sessions: List[Dict]) -> 'go.Figure':
         """
         Create network visualization of phase transitions.
         
@@ -327,49 +535,51 @@ class OuroborosVisualizer:
         Returns:
             Plotly figure with network graph
         """
+        import plotly.graph_objects as go
+        
         # Count transitions
-        transition_counts = {}
-        for session in sessions:
-            if 'phase_transitions' in session['cycles']:
-                for trans in session['cycles']['phase_transitions']:
-                    key = (trans['from_phase'], trans['to_phase'])
-                    transition_counts[key] = transition_counts.get(key, 0) + 1
+        transition_counts = Counter(
+            (trans['from_phase'], trans['to_phase'])
+            for session in sessions
+            for trans in session['cycles'].get('phase_transitions', [])
+        )
         
         if not transition_counts:
             return go.Figure()
         
-        # Create network data
-        phases = ['integration', 'consumption', 'transformation', 'generation']
-        
-        # Node positions (circular layout)
-        theta = np.linspace(0, 2*np.pi, len(phases), endpoint=False)
-        pos = {phase: (np.cos(t), np.sin(t)) for phase, t in zip(phases, theta)}
+        pos = self._phase_pos
         
-        # Create edges
-        edge_trace = []
+        # Create edges, one trace per width bin with None-separated segments
+        num_width_bins = 4
+        max_count = max(transition_counts.values())
+        edge_segments = {}
         for (from_phase, to_phase), count in transition_counts.items():
-            x0, y0 = pos[from_phase]
-            x1, y1 = pos[to_phase]
-            
-            edge_trace.append(go.Scatter(
-                x=[x0, x1, None],
-                y=[y0, y1, None],
+            width_bin = int(np.ceil(count / max_count * num_width_bins))
+            xs, ys = edge_segments.setdefault(width_bin, ([], []))
+            xs.extend((pos[from_phase][0], pos[to_phase][0], None))
+            ys.extend((pos[from_phase][1], pos[to_phase][1], None))
+        
+        edge_trace = [
+            go.Scattergl(
+                x=xs,
+                y=ys,
                 mode='lines',
-                line=dict(width=count/max(transition_counts.values())*10, 
-                         color='gray'),
+                line=dict(width=width_bin / num_width_bins * 10, color='gray'),
                 hoverinfo='skip'
-            ))
+            )
+            for width_bin, (xs, ys) in sorted(edge_segments.items())
+        ]
         
         # Create nodes
-        node_trace = go.Scatter(
-            x=[pos[p][0] for p in phases],
-            y=[pos[p][1] for p in phases],
+        node_trace = go.Scattergl(
+            x=[pos[p][0] for p in PHASES],
+            y=[pos[p][1] for p in PHASES],
             mode='markers+text',
-            text=phases,
+            text=list(PHASES),
             textposition="top center",
             marker=dict(
                 size=50,
-                color=[self.phase_colors[p] for p in phases],
+                color=[self.phase_colors[p] for p in PHASES],
                 line=dict(color='black', width=2)
             ),
             hovertemplate='%{text}<extra></extra>'
@@ -389,7 +599,7 @@ class OuroborosVisualizer:
         
         return fig
     
-    def create_coherence_heatmap(self, all_sessions: Dict[str, List]) -> go.Figure:
+    def create_coherence_heatmap(self, all_sessions: Dict[str, List]) -> 'go.Figure':
         """
         Create heatmap of coherence patterns across models and positions.
         
@@ -399,23 +609,25 @@ class OuroborosVisualizer:
         Returns:
             Plotly heatmap figure
         """
+        import plotly.graph_objects as go
+        
         # Prepare data for heatmap
         max_length = OUROBOROS_CONFIG['conversation_length']
         models = list(all_sessions.keys())
         
-        coherence_matrix = []
-        for model in models:
-            model_coherence = []
-            for pos in range(max_length):
-                coherences = []
-                for session in all_sessions[model]:
-                    if pos < len(session['metrics']):
-                        coherences.append(session['metrics'][pos]['coherence'])
-                
-                avg_coherence = np.mean(coherences) if coherences else 0
-                model_coherence.append(avg_coherence)
+        coherence_matrix = np.zeros((len(models), max_length), dtype=np.float64)
+        for row, model in enumerate(models):
+            # Ragged sessions padded with NaN into one (sessions, positions) matrix
+            sessions = all_sessions[model]
+            padded = np.full((len(sessions), max_length), np.nan, dtype=np.float64)
+            for i, session in enumerate(sessions):
+                coherence = self._get_arrays(session)['coherence'][:max_length]
+                padded[i, :len(coherence)] = coherence
             
-            coherence_matrix.append(model_coherence)
+            # nanmean per position; positions no session reached stay 0
+            counts = np.count_nonzero(~np.isnan(padded), axis=0)
+            np.divide(np.nansum(padded, axis=0), counts,
+                      out=coherence_matrix[row], where=counts > 0)
         
         # Create heatmap
         fig = go.Figure(data=go.Heatmap(
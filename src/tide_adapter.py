@@ -5,8 +5,19 @@ Hillary Danan - August 2025
 """
 
 import json
+import itertools
+import numpy as np
 from typing import List, Dict, Optional
-from config import OUROBOROS_CONFIG, OUROBOROS_PROMPTS
+from config import OUROBOROS_CONFIG, OUROBOROS_PROMPTS, PHASES
+from ouroboros_utils import stack_phase_markers
+
+# TIDE dimensions averaged into each ouroboros phase (customize based on your TIDE dimensions)
+TIDE_PHASE_DIMENSIONS = {
+    'integration': ['coherence', 'consistency', 'sequential', 'logical'],
+    'consumption': ['entropy', 'contradiction', 'questioning', 'breaking'],
+    'transformation': ['novelty', 'exploration', 'recombination', 'synthesis'],
+    'generation': ['emergence', 'structure', 'unity', 'crystallization']
+}
 
 class TIDEOuroborosAdapter:
     """
@@ -32,6 +43,15 @@ class TIDEOuroborosAdapter:
         # Extend with ouroboros parameters
         self.config = {**self.tide_config, **OUROBOROS_CONFIG}
         
+        # Dimension -> phase averaging as a (phases, dimensions) weight matrix
+        self._dim_names = sorted({dim for dims in TIDE_PHASE_DIMENSIONS.values() for dim in dims})
+        self._dim_index = {dim: i for i, dim in enumerate(self._dim_names)}
+        self._W = np.zeros((len(PHASES), len(self._dim_names)), dtype=np.float64)
+        for row, phase in enumerate(PHASES):
+            dimensions = TIDE_PHASE_DIMENSIONS[phase]
+            for dim in dimensions:
+                self._W[row, self._dim_index[dim]] = 1 / len(dimensions)
+        
     def prepare_prompts_for_cycle_detection(self) -> List[str]:
         """
         Modify existing TIDE prompts to potentially trigger cycles.
@@ -54,30 +74,28 @@ class TIDEOuroborosAdapter:
             "Connect all the dots - what's the bigger picture?"
         ]
         
-        # Interleave triggers with base prompts
-        ouroboros_prompts = []
-        trigger_idx = 0
+        conversation_length = self.config['conversation_length']
+        trigger_iter = iter(cycle_triggers)
         
-        for i, prompt in enumerate(base_prompts):
-            ouroboros_prompts.append(prompt)
-            
-            # Every 3rd prompt, add a trigger
-            if (i + 1) % 3 == 0 and trigger_idx < len(cycle_triggers):
-                ouroboros_prompts.append(cycle_triggers[trigger_idx])
-                trigger_idx += 1
-        
-        # Ensure we have enough prompts
-        while len(ouroboros_prompts) < self.config['conversation_length']:
-            if trigger_idx < len(cycle_triggers):
-                ouroboros_prompts.append(cycle_triggers[trigger_idx])
-                trigger_idx += 1
-            else:
-                # Add from ouroboros defaults
-                remaining = self.config['conversation_length'] - len(ouroboros_prompts)
-                ouroboros_prompts.extend(OUROBOROS_PROMPTS[-remaining:])
-                break
+        # Interleave triggers with base prompts: every 3rd prompt, add a trigger
+        interleaved = itertools.chain.from_iterable(
+            (prompt, next(trigger_iter, None)) if (i + 1) % 3 == 0 else (prompt,)
+            for i, prompt in enumerate(base_prompts)
+        )
+        
+        # Unused triggers top up a short list; the shared iterator is drained lazily
+        stream = itertools.chain(
+            (prompt for prompt in interleaved if prompt is not None),
+            trigger_iter
+        )
+        ouroboros_prompts = list(itertools.islice(stream, conversation_length))
+        
+        # Still short: add from ouroboros defaults
+        remaining = conversation_length - len(ouroboros_prompts)
+        if remaining > 0:
+            ouroboros_prompts.extend(OUROBOROS_PROMPTS[-remaining:])
                 
-        return ouroboros_prompts[:self.config['conversation_length']]
+        return ouroboros_prompts
     
     def map_tide_dimensions_to_phases(self, tide_scores: Dict[str, float]) -> Dict[str, float]:
         """
@@ -89,21 +107,25 @@ class TIDEOuroborosAdapter:
         Returns:
             Dictionary of phase scores
         """
-        # Mapping logic (customize based on your TIDE dimensions)
-        phase_mapping = {
-            'integration': ['coherence', 'consistency', 'sequential', 'logical'],
-            'consumption': ['entropy', 'contradiction', 'questioning', 'breaking'],
-            'transformation': ['novelty', 'exploration', 'recombination', 'synthesis'],
-            'generation': ['emergence', 'structure', 'unity', 'crystallization']
-        }
+        tide_vector = np.fromiter(
+            (tide_scores.get(dim, 0) for dim in self._dim_names),
+            dtype=np.float64, count=len(self._dim_names)
+        )
+        phase_scores = self._W @ tide_vector
         
-        phase_scores = {}
+        return {phase: float(score) for phase, score in zip(PHASES, phase_scores)}
+    
+    def map_tide_dimensions_batch(self, tide_score_matrix: np.ndarray) -> np.ndarray:
+        """
+        Map many TIDE score vectors to ouroboros phases at once.
         
-        for phase, dimensions in phase_mapping.items():
-            scores = [tide_scores.get(dim, 0) for dim in dimensions]
-            phase_scores[phase] = sum(scores) / len(scores) if scores else 0
+        Args:
+            tide_score_matrix: (N, D) array, columns ordered as self._dim_names
             
-        return phase_scores
+        Returns:
+            (len(PHASES), N) array of phase scores, rows in PHASES order
+        """
+        return self._W @ np.asarray(tide_score_matrix, dtype=np.float64).T
     
     def enhance_tide_metrics_with_ouroboros(self, tide_metrics: Dict) -> Dict:
         """
@@ -124,6 +146,50 @@ class TIDEOuroborosAdapter:
         
         return enhanced
     
+    def enhance_tide_metrics_batch(self, tide_metrics_list: List[Dict]) -> List[Dict]:
+        """
+        Enhance a batch of TIDE metrics records in one pass.
+        
+        Equivalent to calling enhance_tide_metrics_with_ouroboros on each record,
+        but the numeric heuristics run once over column arrays.
+        
+        Args:
+            tide_metrics_list: Original TIDE metrics records
+            
+        Returns:
+            List of enhanced metrics dictionaries
+        """
+        # Imported here so plain adapter use doesn't load numba
+        import ouroboros_kernels
+        
+        n = len(tide_metrics_list)
+        
+        def column(getter):
+            return np.fromiter((getter(m) for m in tide_metrics_list), dtype=np.float64, count=n)
+        
+        # Same per-field defaults as the scalar helpers
+        cycle_positions = ouroboros_kernels.batch_cycle_position(
+            column(lambda m: m.get('coherence', 0.5)),
+            column(lambda m: m.get('entropy', 0.5))
+        )
+        transformation_potentials = ouroboros_kernels.batch_transformation_potential(
+            column(lambda m: m.get('entropy', 0)),
+            column(lambda m: m.get('vocabulary_evolution', {}).get('novelty_ratio', 0)),
+            column(lambda m: m.get('semantic_drift', 0))
+        )
+        
+        phase_confidences = self._batch_phase_confidence(tide_metrics_list)
+        
+        enhanced_list = []
+        for i, tide_metrics in enumerate(tide_metrics_list):
+            enhanced = tide_metrics.copy()
+            enhanced['cycle_position'] = float(cycle_positions[i])
+            enhanced['phase_confidence'] = float(phase_confidences[i])
+            enhanced['transformation_potential'] = float(transformation_potentials[i])
+            enhanced_list.append(enhanced)
+            
+        return enhanced_list
+    
     def _estimate_cycle_position(self, metrics: Dict) -> float:
         """
         Estimate position within an ouroboros cycle based on metrics.
@@ -171,6 +237,29 @@ class TIDEOuroborosAdapter:
                 return max_score - avg_score
         return 0.5
     
+    def _batch_phase_confidence(self, metrics: List[Dict]) -> np.ndarray:
+        """
+        Vectorized _calculate_phase_confidence over a batch of records.
+        
+        Args:
+            metrics: Metrics records
+            
+        Returns:
+            Confidence scores (0-1)
+        """
+        stacked = stack_phase_markers(metrics)
+        confidence = stacked.max(axis=1) - stacked.mean(axis=1)
+        
+        standard_phases = set(PHASES)
+        for i, m in enumerate(metrics):
+            markers = m.get('phase_markers')
+            if not markers:
+                confidence[i] = 0.5
+            elif markers.keys() != standard_phases:
+                # Non-standard marker sets keep the scalar definition
+                confidence[i] = self._calculate_phase_confidence(m)
+        return confidence
+    
     def _assess_transformation_potential(self, metrics: Dict) -> float:
         """
         Assess potential for transformation in current state.